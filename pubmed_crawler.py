@@ -13,21 +13,25 @@ PubMed에서 논문을 검색하고 PMC에서 PDF를 다운로드하는 크롤
 """
 
 import requests
+import requests_cache
 import os
 import sys
 import io
 import time
 import argparse
-import json
+import orjson
 import re
 import tarfile
-import tempfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from urllib.parse import urljoin
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple
 from bs4 import BeautifulSoup
-from xml.etree import ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree as ET
 
 # Windows 콘솔 UTF-8 인코딩 설정
 if sys.platform == 'win32':
@@ -51,6 +55,28 @@ def load_env_file():
 load_env_file()
 
 
+class RateLimiter:
+    """여러 스레드가 공유하는 요청 간격 제한기"""
+    
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 요청 사이 최소 간격 (초)
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """다음 요청 슬롯까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class PubMedCrawler:
     """PubMed/PMC에서 논문 PDF를 크롤링하는 클래스"""
     
@@ -60,49 +86,154 @@ class PubMedCrawler:
     ELINK_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/elink.fcgi"
     PMC_OA_URL = "https://www.ncbi.nlm.nih.gov/pmc/utils/oa/oa.fcgi"
     
-    def __init__(self, output_dir: str = "downloads", api_key: Optional[str] = None):
+    # 커넥션 풀을 공유할 NCBI 호스트
+    NCBI_HOSTS = (
+        "https://eutils.ncbi.nlm.nih.gov",
+        "https://www.ncbi.nlm.nih.gov",
+        "https://ftp.ncbi.nlm.nih.gov",
+    )
+    
+    # ESearch 한 번에 받을 최대 결과 수 (NCBI 제한)
+    ESEARCH_PAGE_SIZE = 10000
+    
+    # PubMed EFetch 한 번에 요청할 ID 수 (POST로 보내므로 URL 길이 제한 없음)
+    EFETCH_BATCH_SIZE = 500
+    
+    # PMC 전문 EFetch 및 crawl 파이프라인 배치 크기
+    # (작게 나눠야 첫 배치 도착 즉시 다운로드가 시작되고 배치들이 동시에 진행됨)
+    PMC_BATCH_SIZE = 50
+    
+    # OA 서비스 한 번에 조회할 ID 수 (URL 길이 제한 고려)
+    OA_BATCH_SIZE = 50
+    
+    # 파일 저장 시 복사 버퍼 크기 (1 MiB)
+    COPY_BUFFER_SIZE = 1 << 20
+    
+    # 파일명 정리용 정규식
+    _UNSAFE_CHARS = re.compile(r'[<>:"/\\|?*]')
+    _WHITESPACE = re.compile(r'[\s_]+')
+    
+    # PMC 메타데이터 XPath (한 번만 컴파일해서 모든 배치에서 재사용)
+    # 예전 후보 경로들은 모두 첫 경로의 부분집합이라 필드마다 식 하나로 충분하다
+    _ARTICLE_ID_XP = ET.XPath('.//article-id')
+    _TITLE_XP = ET.XPath('normalize-space((.//article-title)[1])', smart_strings=False)
+    _AUTHOR_XP = ET.XPath('.//contrib[@contrib-type="author"]')
+    _SURNAME_XP = ET.XPath('normalize-space(.//surname)', smart_strings=False)
+    _GIVEN_NAMES_XP = ET.XPath('normalize-space(.//given-names)', smart_strings=False)
+    _JOURNAL_XP = ET.XPath(
+        'normalize-space((.//journal-title)[normalize-space(text())][1])',
+        smart_strings=False)
+    _YEAR_XP = ET.XPath(
+        'normalize-space((.//pub-date/year)[normalize-space(text())][1])',
+        smart_strings=False)
+    
+    # 응답 캐시 유지 시간 (초)
+    CACHE_EXPIRE_AFTER = 86400
+    
+    def __init__(self, output_dir: str = "downloads", api_key: Optional[str] = None,
+                 max_workers: int = 8, use_cache: bool = True, quiet: bool = False):
         """
         크롤러 초기화
         
         Args:
             output_dir: PDF 저장 디렉토리
             api_key: NCBI API 키 (선택사항, 없으면 환경변수 NCBI_API_KEY 사용)
+            max_workers: 작업 스레드 풀 크기 (메타데이터 조회와 다운로드 각각, FTP 동시 다운로드 상한)
+            use_cache: eSearch/eFetch/OA 응답을 output_dir에 캐시할지 여부
+            quiet: 논문별 진행 상황 출력 생략 (요약만 출력)
         """
         self.output_dir = output_dir
         # API 키: 인자 > 환경변수 > None 순으로 확인
         self.api_key = api_key if api_key else os.environ.get('NCBI_API_KEY')
-        self.session = requests.Session()
+        
+        # 출력 디렉토리 생성
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # 재실행 시 NCBI 요청을 줄이기 위한 HTTP 캐시 (PDF/tgz 파일은 캐시하지 않음)
+        self.use_cache = use_cache
+        if use_cache:
+            self.session = requests_cache.CachedSession(
+                cache_name=os.path.join(output_dir, 'ncbi_cache'),
+                backend='sqlite',
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                allowable_methods=['GET', 'POST'],
+                urls_expire_after={'ftp.ncbi.nlm.nih.gov': requests_cache.DO_NOT_CACHE}
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'PubMedCrawler/1.0 (Academic Research Purpose; Contact: researcher@example.com)'
         })
         
-        # API 키가 있으면 초당 10회
-        self.request_delay = 0.34 if self.api_key else 0.5
+        self.max_workers = max(1, max_workers)
         
-        # 출력 디렉토리 생성
-        os.makedirs(output_dir, exist_ok=True)
+        # Keep-alive 커넥션 풀 + 자동 재시도 (429/5xx, Retry-After 준수)
+        # E-utilities POST는 조회 전용이라 GET과 마찬가지로 재시도해도 안전하다
+        # 풀은 호스트별로 따로 잡히고 한 호스트에는 최대 max_workers개 스레드가
+        # 동시에 접근하므로, --workers가 100을 넘어도 커넥션이 버려지지 않도록 맞춘다
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        pool_size = max(100, self.max_workers)
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=pool_size, max_retries=retry)
+        for host in self.NCBI_HOSTS:
+            self.session.mount(host, adapter)
+        
+        # API 키가 있으면 초당 10회, 없으면 초당 3회 (모든 스레드 합산)
+        self.request_delay = 0.1 if self.api_key else 0.34
+        self.rate_limiter = RateLimiter(self.request_delay)
+        
+        # FTP 서버 동시 다운로드 수 제한 (crawl 밖에서 여러 스레드가 호출해도 적용)
+        self._download_slots = threading.BoundedSemaphore(self.max_workers)
         
         # 로그 파일
         self.log_file = os.path.join(output_dir, "crawl_log.json")
+        self.quiet = quiet
+        
+        # 파일 경로 생성용 접두어 (논문마다 os.path.join 호출하지 않도록)
+        self._out_prefix = os.path.join(output_dir, '')
         self.results_log = []
         
-    def _make_request(self, url: str, params: Dict = None, retry_count: int = 3) -> Optional[requests.Response]:
-        """API 요청 수행 (재시도 로직 포함)"""
+        # output_dir에 이미 있는 파일명 (crawl 시작 시 한 번만 스캔, None이면 매번 stat)
+        self._existing_files: Optional[set] = None
+        
+    def _make_request(self, url: str, params: Dict = None, stream: bool = False,
+                      method: str = 'GET') -> Optional[requests.Response]:
+        """API 요청 수행 (재시도는 세션 어댑터가 처리)
+        
+        Args:
+            stream: True면 본문을 미리 읽지 않음 (_iter_elements로 스트리밍 파싱)
+            method: 'POST'면 파라미터를 본문으로 전송 (긴 ID 목록의 URL 길이 제한 회피)
+        """
         if params is None:
             params = {}
         if self.api_key:
             params['api_key'] = self.api_key
             
-        for attempt in range(retry_count):
-            try:
-                time.sleep(self.request_delay)
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                return response
-            except requests.exceptions.RequestException as e:
-                print(f"  [!] Request failed (attempt {attempt + 1}/{retry_count}): {e}")
-                if attempt < retry_count - 1:
-                    time.sleep(2 ** attempt)
+        if method == 'POST':
+            kwargs = {'data': params}
+        else:
+            kwargs = {'params': params}
+            
+        try:
+            response = None
+            if self.use_cache:
+                # 캐시에 있으면 rate limit 대기 없이 바로 사용
+                response = self.session.request(method, url, stream=stream, only_if_cached=True, **kwargs)
+                if response.status_code == 504:
+                    response = None
+            if response is None:
+                self.rate_limiter.wait()
+                response = self.session.request(method, url, stream=stream, timeout=30, **kwargs)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            print(f"  [!] Request failed: {e}")
         return None
     
     def search_pmc(self, query: str, max_results: int = 100, 
@@ -114,45 +245,74 @@ class PubMedCrawler:
         Args:
             sort: 'relevance' (Best match) 또는 'date' (Most recent)
         """
+        pmc_ids, _, _ = self._search_pmc_with_history(query, max_results, start_date, end_date, sort)
+        return pmc_ids
+    
+    def _search_pmc_with_history(self, query: str, max_results: int = 100,
+                                 start_date: Optional[str] = None,
+                                 end_date: Optional[str] = None,
+                                 sort: str = "date") -> Tuple[List[str], Optional[str], Optional[str]]:
+        """PMC 검색 후 (PMC ID 목록, WebEnv, query_key) 반환
+        
+        결과가 ESEARCH_PAGE_SIZE보다 많으면 retstart로 나눠서 받는다.
+        WebEnv/query_key는 EFetch에서 ID 목록 대신 History 서버 참조로 사용한다.
+        """
         sort_display = "Best match" if sort == "relevance" else "Most recent"
         print(f"\n[*] Searching PMC (Open Access): '{query}' [Sort: {sort_display}]")
         
-        params = {
-            'db': 'pmc',
-            'term': query,
-            'retmax': max_results,
-            'retmode': 'json',
-            'usehistory': 'y',
-            'sort': sort
-        }
-        
-        if start_date and end_date:
-            params['datetype'] = 'pdat'
-            params['mindate'] = start_date
-            params['maxdate'] = end_date
+        pmc_ids = []
+        webenv = None
+        query_key = None
+        total_count = None
         
-        response = self._make_request(self.ESEARCH_URL, params)
-        
-        if not response:
-            print("[X] Search failed")
-            return []
+        while len(pmc_ids) < max_results:
+            page_size = min(self.ESEARCH_PAGE_SIZE, max_results - len(pmc_ids))
+            params = {
+                'db': 'pmc',
+                'term': query,
+                'retstart': len(pmc_ids),
+                'retmax': page_size,
+                'retmode': 'json',
+                'usehistory': 'y',
+                'sort': sort
+            }
             
-        data = response.json()
-        
-        if 'esearchresult' not in data:
-            print("[X] Failed to parse search results")
-            return []
+            if start_date and end_date:
+                params['datetype'] = 'pdat'
+                params['mindate'] = start_date
+                params['maxdate'] = end_date
             
-        result = data['esearchresult']
-        total_count = int(result.get('count', 0))
-        id_list = result.get('idlist', [])
-        
-        # PMC ID 형식으로 변환
-        pmc_ids = [f"PMC{id}" for id in id_list]
+            response = self._make_request(self.ESEARCH_URL, params)
+            
+            if not response:
+                print("[X] Search failed")
+                break
+                
+            data = orjson.loads(response.content)
+            
+            if 'esearchresult' not in data:
+                print("[X] Failed to parse search results")
+                break
+                
+            result = data['esearchresult']
+            total_count = int(result.get('count', 0))
+            id_list = result.get('idlist', [])
+            
+            # 첫 페이지의 History 참조를 사용 (이후 페이지도 같은 검색 결과 순서)
+            if webenv is None:
+                webenv = result.get('webenv')
+                query_key = result.get('querykey')
+            
+            # PMC ID 형식으로 변환
+            pmc_ids.extend(f"PMC{id}" for id in id_list)
+            
+            if len(id_list) < page_size:
+                break
         
-        print(f"    Found {total_count:,} total results, fetched {len(pmc_ids)}")
+        if total_count is not None:
+            print(f"    Found {total_count:,} total results, fetched {len(pmc_ids)}")
         
-        return pmc_ids
+        return pmc_ids, webenv, query_key
     
     def search_pubmed(self, query: str, max_results: int = 100, 
                       start_date: Optional[str] = None, 
@@ -185,7 +345,7 @@ class PubMedCrawler:
             print("[X] Search failed")
             return []
             
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if 'esearchresult' not in data:
             print("[X] Failed to parse search results")
@@ -199,124 +359,181 @@ class PubMedCrawler:
         
         return id_list
     
+    def _iter_elements(self, response: requests.Response, tag):
+        """응답 본문을 스트리밍으로 파싱하며 tag 요소를 하나씩 반환
+        
+        본문 전체를 bytes로 읽지 않고, 처리가 끝난 요소는 바로 메모리에서 해제한다.
+        반복이 끝나거나 중단되면 응답을 닫는다.
+        """
+        with response:
+            response.raw.decode_content = True
+            for _, elem in ET.iterparse(response.raw, tag=tag):
+                yield elem
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    
+    def _fetch_batches(self, fetch_batch, ids: List[str], batch_size: int) -> Dict:
+        """ID 목록을 batch_size 단위로 나눠 동시에 요청하고 결과 병합"""
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+        merged = {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for result in executor.map(fetch_batch, batches):
+                merged.update(result)
+                
+        return merged
+    
     def get_pmc_ids(self, pubmed_ids: List[str]) -> Dict[str, str]:
         """PubMed ID를 PMC ID로 변환 (EFetch 사용)"""
         print(f"\n[*] Looking up PMC IDs ({len(pubmed_ids)} articles)...")
         
+        pmc_map = self._fetch_batches(self._fetch_pmc_ids_batch, pubmed_ids,
+                                      self.EFETCH_BATCH_SIZE)
+        
+        print(f"    {len(pmc_map)} articles available in PMC (Open Access)")
+        
+        return pmc_map
+    
+    def _fetch_pmc_ids_batch(self, batch: List[str]) -> Dict[str, str]:
+        """PubMed ID 한 배치의 PMC ID 매핑"""
         pmc_map = {}
-        batch_size = 100
         
-        for i in range(0, len(pubmed_ids), batch_size):
-            batch = pubmed_ids[i:i + batch_size]
-            
-            params = {
-                'db': 'pubmed',
-                'id': ','.join(batch),
-                'retmode': 'xml'
-            }
-            
-            response = self._make_request(self.EFETCH_URL, params)
+        params = {
+            'db': 'pubmed',
+            'id': ','.join(batch),
+            'retmode': 'xml'
+        }
+        
+        response = self._make_request(self.EFETCH_URL, params, stream=True, method='POST')
+        
+        if not response:
+            return pmc_map
             
-            if not response:
-                continue
-                
-            try:
-                root = ET.fromstring(response.content)
+        try:
+            for article in self._iter_elements(response, 'PubmedArticle'):
+                # PMID 가져오기
+                pmid_elem = article.find('.//PMID')
+                if pmid_elem is None or not pmid_elem.text:
+                    continue
+                pmid = pmid_elem.text
                 
-                for article in root.findall('.//PubmedArticle'):
-                    # PMID 가져오기
-                    pmid_elem = article.find('.//PMID')
-                    if pmid_elem is None or not pmid_elem.text:
-                        continue
-                    pmid = pmid_elem.text
+                # PMC ID 가져오기 (첫 번째 것만)
+                pmc_elem = article.find('.//ArticleId[@IdType="pmc"]')
+                if pmc_elem is not None and pmc_elem.text:
+                    pmc_id = pmc_elem.text
+                    if not pmc_id.startswith('PMC'):
+                        pmc_id = f"PMC{pmc_id}"
+                    pmc_map[pmid] = pmc_id
                     
-                    # PMC ID 가져오기 (첫 번째 것만)
-                    pmc_elem = article.find('.//ArticleId[@IdType="pmc"]')
-                    if pmc_elem is not None and pmc_elem.text:
-                        pmc_id = pmc_elem.text
-                        if not pmc_id.startswith('PMC'):
-                            pmc_id = f"PMC{pmc_id}"
-                        pmc_map[pmid] = pmc_id
-                        
-            except Exception as e:
-                print(f"  [!] PMC ID parsing error: {e}")
-                
-        print(f"    {len(pmc_map)} articles available in PMC (Open Access)")
-        
+        except Exception as e:
+            print(f"  [!] PMC ID parsing error: {e}")
+            
         return pmc_map
     
     def get_article_info(self, pubmed_ids: List[str]) -> Dict[str, Dict]:
         """논문 메타데이터 가져오기"""
         print(f"\n[*] Fetching article metadata...")
         
+        articles = self._fetch_batches(self._fetch_article_info_batch, pubmed_ids,
+                                       self.EFETCH_BATCH_SIZE)
+        
+        print(f"    Collected info for {len(articles)} articles")
+        
+        return articles
+    
+    def _fetch_article_info_batch(self, batch: List[str]) -> Dict[str, Dict]:
+        """PubMed 메타데이터 한 배치 가져오기"""
         articles = {}
-        batch_size = 100
         
-        for i in range(0, len(pubmed_ids), batch_size):
-            batch = pubmed_ids[i:i + batch_size]
-            
-            params = {
-                'db': 'pubmed',
-                'id': ','.join(batch),
-                'retmode': 'xml'
-            }
-            
-            response = self._make_request(self.EFETCH_URL, params)
+        params = {
+            'db': 'pubmed',
+            'id': ','.join(batch),
+            'retmode': 'xml'
+        }
+        
+        response = self._make_request(self.EFETCH_URL, params, stream=True, method='POST')
+        
+        if not response:
+            return articles
             
-            if not response:
-                continue
+        try:
+            for article in self._iter_elements(response, 'PubmedArticle'):
+                pmid_elem = article.find('.//PMID')
+                if pmid_elem is None:
+                    continue
+                    
+                pmid = pmid_elem.text
                 
-            try:
-                root = ET.fromstring(response.content)
+                title_elem = article.find('.//ArticleTitle')
+                title = title_elem.text if title_elem is not None and title_elem.text else "Unknown"
                 
-                for article in root.findall('.//PubmedArticle'):
-                    pmid_elem = article.find('.//PMID')
-                    if pmid_elem is None:
-                        continue
-                        
-                    pmid = pmid_elem.text
-                    
-                    title_elem = article.find('.//ArticleTitle')
-                    title = title_elem.text if title_elem is not None and title_elem.text else "Unknown"
-                    
-                    authors = []
-                    for author in article.findall('.//Author'):
-                        lastname = author.find('LastName')
-                        forename = author.find('ForeName')
-                        if lastname is not None and lastname.text:
-                            name = lastname.text
-                            if forename is not None and forename.text:
-                                name = f"{forename.text} {name}"
-                            authors.append(name)
-                    
-                    journal_elem = article.find('.//Journal/Title')
-                    journal = journal_elem.text if journal_elem is not None and journal_elem.text else "Unknown"
-                    
-                    year_elem = article.find('.//PubDate/Year')
-                    year = year_elem.text if year_elem is not None and year_elem.text else "Unknown"
-                    
-                    doi = None
-                    for aid in article.findall('.//ArticleId'):
-                        if aid.get('IdType') == 'doi':
-                            doi = aid.text
-                            break
-                    
-                    articles[pmid] = {
-                        'pmid': pmid,
-                        'title': title,
-                        'authors': authors,
-                        'journal': journal,
-                        'year': year,
-                        'doi': doi
-                    }
-                    
-            except Exception as e:
-                print(f"  [!] Metadata parsing error: {e}")
+                authors = []
+                for author in article.findall('.//Author'):
+                    lastname = author.find('LastName')
+                    forename = author.find('ForeName')
+                    if lastname is not None and lastname.text:
+                        name = lastname.text
+                        if forename is not None and forename.text:
+                            name = f"{forename.text} {name}"
+                        authors.append(name)
                 
-        print(f"    Collected info for {len(articles)} articles")
-        
+                journal_elem = article.find('.//Journal/Title')
+                journal = journal_elem.text if journal_elem is not None and journal_elem.text else "Unknown"
+                
+                year_elem = article.find('.//PubDate/Year')
+                year = year_elem.text if year_elem is not None and year_elem.text else "Unknown"
+                
+                doi = None
+                for aid in article.findall('.//ArticleId'):
+                    if aid.get('IdType') == 'doi':
+                        doi = aid.text
+                        break
+                
+                # PMC ID (PMC에 없는 논문은 None)
+                pmc_id = None
+                pmc_elem = article.find('./PubmedData/ArticleIdList/ArticleId[@IdType="pmc"]')
+                if pmc_elem is not None and pmc_elem.text:
+                    pmc_id = pmc_elem.text
+                    if not pmc_id.startswith('PMC'):
+                        pmc_id = f"PMC{pmc_id}"
+                
+                articles[pmid] = {
+                    'pmid': pmid,
+                    'title': title,
+                    'authors': authors,
+                    'journal': journal,
+                    'year': year,
+                    'doi': doi,
+                    'pmc_id': pmc_id
+                }
+                
+        except Exception as e:
+            print(f"  [!] Metadata parsing error: {e}")
+            
         return articles
     
+    def _select_oa_link(self, elem) -> Optional[Tuple[str, str]]:
+        """OA 응답 요소 아래의 링크 중 다운로드할 것 선택 (PDF 우선)"""
+        pdf_link = None
+        tgz_link = None
+        
+        for link in elem.iter('link'):
+            fmt = link.get('format', '')
+            href = link.get('href', '')
+            
+            if fmt == 'pdf' and not pdf_link:
+                pdf_link = href
+            elif fmt == 'tgz' and not tgz_link:
+                tgz_link = href
+        
+        # PDF 우선 반환
+        if pdf_link:
+            return (pdf_link, 'pdf')
+        elif tgz_link:
+            return (tgz_link, 'tgz')
+        return None
+    
     def get_oa_download_link(self, pmc_id: str) -> Optional[Tuple[str, str]]:
         """
         NCBI OA Service를 통해 다운로드 링크 가져오기
@@ -325,37 +542,27 @@ class PubMedCrawler:
             (url, format) 튜플 또는 None
         """
         params = {'id': pmc_id}
-        response = self._make_request(self.PMC_OA_URL, params)
+        response = self._make_request(self.PMC_OA_URL, params, stream=True)
         
         if not response:
             return None
             
         try:
-            root = ET.fromstring(response.content)
-            
-            # 에러 체크
-            error = root.find('.//error')
-            if error is not None:
-                return None
-            
-            # 모든 레코드에서 다운로드 링크 찾기
-            pdf_link = None
             tgz_link = None
             
-            for record in root.findall('.//record'):
-                for link in record.findall('.//link'):
-                    fmt = link.get('format', '')
-                    href = link.get('href', '')
-                    
-                    if fmt == 'pdf' and not pdf_link:
-                        pdf_link = href
-                    elif fmt == 'tgz' and not tgz_link:
-                        tgz_link = href
-            
-            # PDF 우선 반환
-            if pdf_link:
-                return (pdf_link, 'pdf')
-            elif tgz_link:
+            for elem in self._iter_elements(response, ('error', 'link')):
+                # 에러 체크
+                if elem.tag == 'error':
+                    return None
+                
+                # PDF 링크를 찾으면 나머지 응답은 읽지 않음
+                fmt = elem.get('format', '')
+                if fmt == 'pdf':
+                    return (elem.get('href', ''), 'pdf')
+                elif fmt == 'tgz' and not tgz_link:
+                    tgz_link = elem.get('href', '')
+            
+            if tgz_link:
                 return (tgz_link, 'tgz')
                 
         except Exception as e:
@@ -363,23 +570,85 @@ class PubMedCrawler:
             
         return None
     
-    def download_from_ftp(self, ftp_url: str, local_path: str) -> bool:
-        """FTP URL에서 파일 다운로드"""
-        try:
-            # FTP URL을 HTTP로 변환 (NCBI FTP는 HTTP로도 접근 가능)
-            if ftp_url.startswith('ftp://'):
-                http_url = ftp_url.replace('ftp://ftp.ncbi.nlm.nih.gov', 
-                                           'https://ftp.ncbi.nlm.nih.gov')
+    def get_oa_download_links_bulk(self, pmc_ids: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        여러 논문의 OA 다운로드 링크를 OA_BATCH_SIZE개씩 묶어서 조회
+        
+        Returns:
+            {pmc_id: (url, format)} (OA 링크가 없는 논문은 제외)
+        """
+        links = {}
+        
+        for i in range(0, len(pmc_ids), self.OA_BATCH_SIZE):
+            batch = pmc_ids[i:i + self.OA_BATCH_SIZE]
+            batch_links = self._fetch_oa_links_batch(batch)
+            
+            if batch_links is None:
+                # 일괄 조회가 실패하거나 거부되면 논문별로 조회
+                for pmc_id in batch:
+                    link_info = self.get_oa_download_link(pmc_id)
+                    if link_info:
+                        links[pmc_id] = link_info
             else:
-                http_url = ftp_url
+                links.update(batch_links)
+                
+        return links
+    
+    def _fetch_oa_links_batch(self, batch: List[str]) -> Optional[Dict[str, Tuple[str, str]]]:
+        """OA 링크 한 배치 조회 (요청/파싱 실패 또는 레코드 없이 에러만 오면 None)"""
+        params = {'id': ','.join(batch)}
+        response = self._make_request(self.PMC_OA_URL, params, stream=True)
+        
+        if not response:
+            return None
             
-            time.sleep(self.request_delay)
-            response = self.session.get(http_url, timeout=120, stream=True)
-            response.raise_for_status()
+        links = {}
+        has_records = False
+        has_error = False
+        try:
+            for elem in self._iter_elements(response, ('record', 'error')):
+                if elem.tag == 'error':
+                    has_error = True
+                    continue
+                
+                has_records = True
+                pmc_id = elem.get('id', '')
+                link_info = self._select_oa_link(elem)
+                if pmc_id and link_info:
+                    links[pmc_id] = link_info
+                    
+        except Exception as e:
+            print(f"  [!] OA link parsing error: {e}")
+            return None
+        
+        if not has_records and has_error and len(batch) > 1:
+            return None
             
-            with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        return links
+    
+    def _open_download(self, ftp_url: str) -> requests.Response:
+        """FTP URL을 HTTPS로 변환해 스트리밍 응답 열기"""
+        # FTP URL을 HTTP로 변환 (NCBI FTP는 HTTP로도 접근 가능)
+        if ftp_url.startswith('ftp://'):
+            http_url = ftp_url.replace('ftp://ftp.ncbi.nlm.nih.gov', 
+                                       'https://ftp.ncbi.nlm.nih.gov')
+        else:
+            http_url = ftp_url
+        
+        self.rate_limiter.wait()
+        response = self.session.get(http_url, timeout=120, stream=True)
+        response.raise_for_status()
+        return response
+    
+    def download_from_ftp(self, ftp_url: str, local_path: str) -> bool:
+        """FTP URL에서 파일 다운로드"""
+        try:
+            with self._download_slots:
+                with self._open_download(ftp_url) as response:
+                    # 큰 버퍼로 직접 복사하므로 파일 버퍼링은 끈다
+                    response.raw.decode_content = True
+                    with open(local_path, 'wb', buffering=0) as f:
+                        shutil.copyfileobj(response.raw, f, self.COPY_BUFFER_SIZE)
                     
             return os.path.getsize(local_path) > 1024
             
@@ -392,52 +661,98 @@ class PubMedCrawler:
         """tar.gz 파일에서 PDF 추출 (PMC ID 매칭 우선)"""
         try:
             with tarfile.open(tgz_path, 'r:gz') as tar:
-                pdf_members = []
-                
-                for member in tar.getmembers():
-                    if member.name.lower().endswith('.pdf'):
-                        pdf_members.append(member)
-                
-                if not pdf_members:
-                    return False
-                
-                # PMC ID가 포함된 PDF 우선 선택
-                target_member = None
                 pmc_num = pmc_id.replace('PMC', '') if pmc_id else ''
+                target_member = None
                 
-                for member in pdf_members:
+                # 멤버를 하나씩 읽다가 PMC ID가 포함된 PDF를 찾으면 바로 중단
+                # (못 찾으면 가장 큰 PDF 선택, 보통 메인 논문)
+                for member in tar:
+                    if not member.isfile() or not member.name.lower().endswith('.pdf'):
+                        continue
                     if pmc_num and pmc_num in member.name:
                         target_member = member
                         break
+                    if target_member is None or member.size > target_member.size:
+                        target_member = member
                 
-                # PMC ID 매칭 안되면 가장 큰 PDF 선택 (보통 메인 논문)
                 if target_member is None:
-                    target_member = max(pdf_members, key=lambda m: m.size)
+                    return False
                 
                 pdf_file = tar.extractfile(target_member)
                 if pdf_file:
-                    with open(output_path, 'wb') as f:
-                        f.write(pdf_file.read())
+                    with pdf_file, open(output_path, 'wb') as f:
+                        shutil.copyfileobj(pdf_file, f, self.COPY_BUFFER_SIZE)
                     return True
                     
             return False
         except Exception as e:
             return False
     
-    def download_article(self, pmc_id: str, filename: str) -> Tuple[bool, str]:
+    def extract_pdf_from_stream(self, fileobj, output_path: str, pmc_id: str = "") -> bool:
+        """tar.gz 스트림에서 PDF 추출 (PMC ID 매칭 우선, 없으면 가장 큰 PDF)
+        
+        앞으로만 읽는 'r|gz' 모드라서 다운로드와 압축 해제가 동시에 진행된다.
+        PMC ID가 포함된 PDF를 찾으면 나머지 아카이브는 읽지 않는다.
+        """
+        pmc_num = pmc_id.replace('PMC', '') if pmc_id else ''
+        best_size = -1
+        
+        try:
+            with tarfile.open(fileobj=fileobj, mode='r|gz') as tar:
+                for member in tar:
+                    if not member.isfile() or not member.name.lower().endswith('.pdf'):
+                        continue
+                    
+                    matched = bool(pmc_num) and pmc_num in member.name
+                    # 매칭되지 않으면 지금까지 받은 PDF보다 클 때만 덮어쓰기
+                    if not matched and member.size <= best_size:
+                        continue
+                    
+                    pdf_file = tar.extractfile(member)
+                    if pdf_file is None:
+                        continue
+                    with pdf_file, open(output_path, 'wb') as f:
+                        shutil.copyfileobj(pdf_file, f, self.COPY_BUFFER_SIZE)
+                    best_size = member.size
+                    
+                    if matched:
+                        break
+                        
+            return best_size >= 0
+        except Exception as e:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return False
+    
+    def _mark_existing(self, filename: str):
+        """다운로드가 끝난 파일을 기존 파일 목록에 추가"""
+        if self._existing_files is not None:
+            self._existing_files.add(filename)
+    
+    def download_article(self, pmc_id: str, filename: str,
+                         oa_links: Optional[Dict[str, Tuple[str, str]]] = None) -> Tuple[bool, str]:
         """
         논문 다운로드 (OA Service 사용)
         
+        Args:
+            oa_links: get_oa_download_links_bulk 결과 (없으면 OA 서비스에 개별 조회)
+        
         Returns:
             (성공 여부, 상태 메시지)
         """
-        filepath = os.path.join(self.output_dir, filename)
+        filepath = f"{self._out_prefix}{filename}"
         
-        if os.path.exists(filepath):
+        if self._existing_files is not None:
+            if filename in self._existing_files:
+                return (True, 'already_exists')
+        elif os.path.exists(filepath):
             return (True, 'already_exists')
         
         # OA 서비스에서 다운로드 링크 가져오기
-        link_info = self.get_oa_download_link(pmc_id)
+        if oa_links is not None:
+            link_info = oa_links.get(pmc_id)
+        else:
+            link_info = self.get_oa_download_link(pmc_id)
         
         if not link_info:
             return (False, 'no_oa_link')
@@ -447,22 +762,26 @@ class PubMedCrawler:
         if fmt == 'pdf':
             # 직접 PDF 다운로드
             if self.download_from_ftp(url, filepath):
+                self._mark_existing(filename)
                 return (True, 'direct_pdf')
             else:
                 return (False, 'download_failed')
                 
         elif fmt == 'tgz':
-            # tar.gz 다운로드 후 PDF 추출
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tgz_path = os.path.join(tmpdir, f"{pmc_id}.tar.gz")
-                
-                if not self.download_from_ftp(url, tgz_path):
+            # tar.gz를 받으면서 바로 PDF 추출 (임시 파일 없음)
+            with self._download_slots:
+                try:
+                    response = self._open_download(url)
+                except requests.exceptions.RequestException:
                     return (False, 'tgz_download_failed')
                 
-                if self.extract_pdf_from_tgz(tgz_path, filepath, pmc_id):
-                    return (True, 'extracted_from_tgz')
-                else:
-                    return (False, 'pdf_extraction_failed')
+                with response:
+                    response.raw.decode_content = True
+                    if self.extract_pdf_from_stream(response.raw, filepath, pmc_id):
+                        self._mark_existing(filename)
+                        return (True, 'extracted_from_tgz')
+                    else:
+                        return (False, 'pdf_extraction_failed')
         
         return (False, 'unknown_format')
     
@@ -470,8 +789,8 @@ class PubMedCrawler:
         """파일명에서 특수문자 제거"""
         if not name:
             name = "Unknown"
-        name = re.sub(r'[<>:"/\\|?*]', '_', name)
-        name = re.sub(r'[\s_]+', '_', name)
+        name = self._UNSAFE_CHARS.sub('_', name)
+        name = self._WHITESPACE.sub('_', name)
         if len(name) > max_length:
             name = name[:max_length]
         return name.strip('_')
@@ -480,95 +799,105 @@ class PubMedCrawler:
         """PMC 논문 메타데이터 가져오기"""
         print(f"\n[*] Fetching PMC article metadata...")
         
-        articles = {}
-        batch_size = 50
-        
         # PMC ID에서 숫자만 추출
         numeric_ids = [pmc_id.replace('PMC', '') for pmc_id in pmc_ids]
         
-        for i in range(0, len(numeric_ids), batch_size):
-            batch = numeric_ids[i:i + batch_size]
-            
+        articles = self._fetch_batches(self._fetch_pmc_article_info_batch, numeric_ids,
+                                       self.PMC_BATCH_SIZE)
+        
+        print(f"    Collected info for {len(articles)} articles")
+        
+        return articles
+    
+    def _fetch_pmc_article_info_batch(self, batch: List[str],
+                                      history: Optional[Tuple[str, str, int]] = None) -> Dict[str, Dict]:
+        """PMC 메타데이터 한 배치 가져오기
+        
+        Args:
+            batch: 숫자 형식 PMC ID 목록
+            history: (WebEnv, query_key, retstart) - 주어지면 ID 목록 대신
+                     History 서버의 검색 결과에서 retstart부터 len(batch)개를 가져옴
+        """
+        if history:
+            webenv, query_key, retstart = history
             params = {
                 'db': 'pmc',
-                'id': ','.join(batch),
+                'WebEnv': webenv,
+                'query_key': query_key,
+                'retstart': retstart,
+                'retmax': len(batch),
                 'retmode': 'xml'
             }
+            articles = self._parse_pmc_articles(
+                self._make_request(self.EFETCH_URL, params, stream=True))
+            if articles:
+                return articles
+            # WebEnv 만료 등으로 결과가 없으면 ID 목록으로 다시 요청
+        
+        params = {
+            'db': 'pmc',
+            'id': ','.join(batch),
+            'retmode': 'xml'
+        }
+        
+        return self._parse_pmc_articles(
+            self._make_request(self.EFETCH_URL, params, stream=True, method='POST'))
+    
+    def _parse_pmc_articles(self, response: Optional[requests.Response]) -> Dict[str, Dict]:
+        """PMC EFetch 응답에서 논문별 메타데이터 추출"""
+        articles = {}
+        
+        if not response:
+            return articles
             
-            response = self._make_request(self.EFETCH_URL, params)
-            
-            if not response:
-                continue
-                
-            try:
-                root = ET.fromstring(response.content)
-                
-                for article in root.findall('.//article'):
-                    # PMC ID 직접 추출 (정확한 매칭을 위해)
-                    pmc_id = None
-                    for aid in article.findall('.//article-id'):
-                        id_type = aid.get('pub-id-type', '')
-                        if id_type in ['pmcid', 'pmc'] and aid.text:
-                            pmc_id = aid.text
-                            if not pmc_id.startswith('PMC'):
-                                pmc_id = f"PMC{pmc_id}"
-                            break
-                        elif id_type == 'pmcaid' and aid.text:
-                            pmc_id = f"PMC{aid.text}"
-                            break
-                    
-                    if not pmc_id:
-                        continue
-                    
-                    # 제목
-                    title = "Unknown"
-                    for title_path in ['.//article-title', './/title-group/article-title']:
-                        title_elem = article.find(title_path)
-                        if title_elem is not None:
-                            title = "".join(title_elem.itertext()).strip()
-                            if title:
-                                break
-                    
-                    # 저자
-                    authors = []
-                    for contrib in article.findall('.//contrib[@contrib-type="author"]'):
-                        surname = contrib.find('.//surname')
-                        given = contrib.find('.//given-names')
-                        if surname is not None and surname.text:
-                            name = surname.text
-                            if given is not None and given.text:
-                                name = f"{given.text} {name}"
-                            authors.append(name)
-                    
-                    # 저널
-                    journal = "Unknown"
-                    for journal_path in ['.//journal-title', './/journal-meta/journal-title']:
-                        journal_elem = article.find(journal_path)
-                        if journal_elem is not None and journal_elem.text:
-                            journal = journal_elem.text.strip()
-                            break
-                    
-                    # 출판 연도 (여러 경로 시도)
-                    year = ""
-                    for year_path in ['.//pub-date/year', './/pub-date[@pub-type="epub"]/year', './/pub-date[@date-type="pub"]/year']:
-                        year_elem = article.find(year_path)
-                        if year_elem is not None and year_elem.text:
-                            year = year_elem.text.strip()
-                            break
-                    
-                    articles[pmc_id] = {
-                        'pmc_id': pmc_id,
-                        'title': title,
-                        'authors': authors,
-                        'journal': journal,
-                        'year': year
-                    }
-                    
-            except Exception as e:
-                print(f"  [!] Metadata parsing error: {e}")
+        try:
+            for article in self._iter_elements(response, 'article'):
+                # PMC ID 직접 추출 (정확한 매칭을 위해)
+                pmc_id = None
+                for aid in self._ARTICLE_ID_XP(article):
+                    id_type = aid.get('pub-id-type', '')
+                    if id_type in ['pmcid', 'pmc'] and aid.text:
+                        pmc_id = aid.text
+                        if not pmc_id.startswith('PMC'):
+                            pmc_id = f"PMC{pmc_id}"
+                        break
+                    elif id_type == 'pmcaid' and aid.text:
+                        pmc_id = f"PMC{aid.text}"
+                        break
                 
-        print(f"    Collected info for {len(articles)} articles")
-        
+                if not pmc_id:
+                    continue
+                
+                # 제목
+                title = self._TITLE_XP(article) or "Unknown"
+                
+                # 저자
+                authors = []
+                for contrib in self._AUTHOR_XP(article):
+                    name = self._SURNAME_XP(contrib)
+                    if name:
+                        given = self._GIVEN_NAMES_XP(contrib)
+                        if given:
+                            name = f"{given} {name}"
+                        authors.append(name)
+                
+                # 저널
+                journal = self._JOURNAL_XP(article) or "Unknown"
+                
+                # 출판 연도
+                year = self._YEAR_XP(article)
+                
+                articles[pmc_id] = {
+                    'pmc_id': pmc_id,
+                    'title': title,
+                    'authors': authors,
+                    'journal': journal,
+                    'year': year
+                }
+                
+        except Exception as e:
+            print(f"  [!] Metadata parsing error: {e}")
+            
         return articles
     
     def crawl(self, query: str, max_results: int = 100,
@@ -588,83 +917,144 @@ class PubMedCrawler:
         
         if source == "pubmed":
             # PubMed 검색 → PMC 매핑
-            pubmed_ids = self.search_pubmed(query, max_results, start_date, end_date, sort)
+            source_ids = self.search_pubmed(query, max_results, start_date, end_date, sort)
             
-            if not pubmed_ids:
+            if not source_ids:
                 return {'status': 'error', 'message': 'No search results'}
             
-            # PMC ID 매핑
-            pmc_map = self.get_pmc_ids(pubmed_ids)
-            
-            if not pmc_map:
-                print("\n[X] No articles available in PMC")
-                return {'status': 'error', 'message': 'No Open Access articles in PMC'}
-            
-            pmc_ids = list(pmc_map.values())
-            
-            # 논문 정보 (PubMed 기준)
-            articles = self.get_article_info(pubmed_ids)
-            # PMC ID로 재매핑
-            pmc_articles = {}
-            for pmid, pmc_id in pmc_map.items():
-                if pmid in articles:
-                    pmc_articles[pmc_id] = articles[pmid]
-            articles = pmc_articles
+            # 같은 EFetch 응답에서 PMC ID와 메타데이터를 함께 추출 (PMC에 없는 논문은 제외)
+            def fetch_metadata(batch: List[str], start: int) -> Dict[str, Dict]:
+                articles = self._fetch_article_info_batch(batch)
+                return {articles[pmid]['pmc_id']: articles[pmid] for pmid in batch
+                        if pmid in articles and articles[pmid]['pmc_id']}
         else:
             # PMC 직접 검색
-            pmc_ids = self.search_pmc(query, max_results, start_date, end_date, sort)
+            source_ids, webenv, query_key = self._search_pmc_with_history(
+                query, max_results, start_date, end_date, sort)
             
-            if not pmc_ids:
+            if not source_ids:
                 return {'status': 'error', 'message': 'No search results'}
             
-            articles = self.get_pmc_article_info(pmc_ids)
+            # 검색 결과를 History 서버에서 바로 가져옴 (ID 목록 전송 없음)
+            def fetch_metadata(batch: List[str], start: int) -> Dict[str, Dict]:
+                history = (webenv, query_key, start) if webenv and query_key else None
+                articles = self._fetch_pmc_article_info_batch(
+                    [pmc_id.replace('PMC', '') for pmc_id in batch], history)
+                return {pmc_id: articles.get(pmc_id, {}) for pmc_id in batch}
+        
+        # 메타데이터 작업 스레드에서 파일명 생성과 OA 링크 조회까지 마치고
+        # 메인 스레드는 다운로드 작업 배분만 한다
+        def fetch_batch(batch: List[str], start: int) -> Tuple[List[Tuple[str, str, str]], Dict[str, Tuple[str, str]]]:
+            articles = fetch_metadata(batch, start)
+            
+            jobs = []
+            for pmc_id, article_info in articles.items():
+                title = article_info.get('title', 'Unknown')
+                year = article_info.get('year', '')
+                
+                # 파일명 생성
+                safe_title = self.sanitize_filename(title)
+                filename = f"{pmc_id}_{year}_{safe_title}.pdf"
+                jobs.append((pmc_id, title, filename))
+                
+            return jobs, self.get_oa_download_links_bulk(list(articles))
         
-        # PDF 다운로드
-        print(f"\n[*] Downloading PDFs ({len(pmc_ids)} articles)...")
+        # 이미 받은 파일 확인용 (논문마다 stat 호출 대신 디렉토리 한 번 스캔)
+        with os.scandir(self.output_dir) as it:
+            self._existing_files = {entry.name for entry in it if entry.is_file()}
+        
+        batches = [source_ids[i:i + self.PMC_BATCH_SIZE]
+                   for i in range(0, len(source_ids), self.PMC_BATCH_SIZE)]
+        
+        # 메타데이터 + PDF 다운로드 파이프라인
+        # 메타데이터 배치가 도착하는 대로 해당 논문들의 다운로드를 바로 시작한다
+        print(f"\n[*] Fetching metadata and downloading PDFs ({len(source_ids)} articles)...")
         
         success_count = 0
         fail_count = 0
+        entries = []
         
-        for i, pmc_id in enumerate(pmc_ids, 1):
-            article_info = articles.get(pmc_id, {})
-            title = article_info.get('title', 'Unknown')
-            year = article_info.get('year', '')
-            
-            # 진행 상황 출력
-            short_title = title[:40] + "..." if len(title) > 40 else title
-            print(f"\n  [{i}/{len(pmc_ids)}] {short_title}")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as meta_executor, \
+             ThreadPoolExecutor(max_workers=self.max_workers) as download_executor:
+            meta_futures = {meta_executor.submit(fetch_batch, batch, batch_index * self.PMC_BATCH_SIZE): batch_index
+                            for batch_index, batch in enumerate(batches)}
             
-            # 파일명 생성
-            safe_title = self.sanitize_filename(title)
-            filename = f"{pmc_id}_{year}_{safe_title}.pdf"
+            # 메타데이터 배치와 다운로드를 한 루프에서 기다려서
+            # 메타데이터 수집 중에도 끝난 다운로드를 바로 출력한다
+            download_futures = {}
+            pending = set(meta_futures)
+            total_count = None
+            done_count = 0
             
-            # 다운로드
-            success, status = self.download_article(pmc_id, filename)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    if future in meta_futures:
+                        try:
+                            jobs, oa_links = future.result()
+                        except Exception as e:
+                            print(f"  [!] Metadata batch failed: {e}")
+                            jobs, oa_links = [], {}
+                        
+                        for position, (pmc_id, title, filename) in enumerate(jobs):
+                            download_future = download_executor.submit(
+                                self.download_article, pmc_id, filename, oa_links)
+                            sort_key = (meta_futures[future], position)
+                            download_futures[download_future] = (sort_key, pmc_id, title, filename)
+                            pending.add(download_future)
+                        continue
+                    
+                    sort_key, pmc_id, title, filename = download_futures[future]
+                    try:
+                        success, status = future.result()
+                    except Exception as e:
+                        success, status = False, f'error: {e}'
+                    
+                    if success:
+                        success_count += 1
+                        entry = {
+                            'pmc_id': pmc_id,
+                            'title': title,
+                            'filename': filename,
+                            'status': status
+                        }
+                        result_line = f"      [OK] Downloaded: {filename[:50]}..."
+                    else:
+                        fail_count += 1
+                        entry = {
+                            'pmc_id': pmc_id,
+                            'title': title,
+                            'status': status
+                        }
+                        result_line = f"      [X] Failed: {status}"
+                    entries.append((sort_key, entry))
+                    done_count += 1
+                    
+                    # 진행 상황 출력 (논문당 한 번만 write, 전체 수는 메타데이터가 모두 도착한 뒤 표시)
+                    if not self.quiet:
+                        short_title = title[:40] + "..." if len(title) > 40 else title
+                        progress = f"{done_count}/{total_count}" if total_count is not None else f"{done_count}"
+                        print(f"\n  [{progress}] {short_title}\n{result_line}")
+                
+                # 메타데이터 배치가 모두 끝나면 전체 다운로드 수 확정
+                if total_count is None and not any(f in meta_futures for f in pending):
+                    total_count = len(download_futures)
             
-            if success:
-                print(f"      [OK] Downloaded: {filename[:50]}...")
-                success_count += 1
-                self.results_log.append({
-                    'pmc_id': pmc_id,
-                    'title': title,
-                    'filename': filename,
-                    'status': status
-                })
-            else:
-                print(f"      [X] Failed: {status}")
-                fail_count += 1
-                self.results_log.append({
-                    'pmc_id': pmc_id,
-                    'title': title,
-                    'status': status
-                })
+            if not total_count:
+                print("\n[X] No articles available in PMC")
+                return {'status': 'error', 'message': 'No Open Access articles in PMC'}
+        
+        # 로그는 검색 결과 순서대로 기록
+        entries.sort(key=lambda item: item[0])
+        self.results_log.extend(entry for _, entry in entries)
         
         # 4. 결과 저장
         elapsed_time = (datetime.now() - start_time).total_seconds()
         
         result_summary = {
             'query': query,
-            'total_found': len(pmc_ids),
+            'total_found': total_count,
             'downloaded': success_count,
             'failed': fail_count,
             'elapsed_time': f"{elapsed_time:.1f}s",
@@ -674,15 +1064,15 @@ class PubMedCrawler:
         }
         
         # 로그 파일 저장
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(result_summary, f, ensure_ascii=False, indent=2)
+        with open(self.log_file, 'wb') as f:
+            f.write(orjson.dumps(result_summary, option=orjson.OPT_INDENT_2))
         
         # 결과 출력
         print("\n" + "="*60)
         print("  Crawling Complete!")
         print("="*60)
         print(f"  Query: {query}")
-        print(f"  Total found: {len(pmc_ids)}")
+        print(f"  Total found: {total_count}")
         print(f"  Downloaded: {success_count}")
         print(f"  Failed: {fail_count}")
         print(f"  Time: {elapsed_time:.1f}s")
@@ -723,12 +1113,22 @@ Examples:
     parser.add_argument('--source', type=str, default='pmc',
                        choices=['pubmed', 'pmc'],
                        help='Search source: pubmed (same as website) or pmc (Open Access only, default)')
+    parser.add_argument('--workers', '-w', type=int, default=8,
+                       help='Worker threads for metadata fetching and downloads; '
+                            'also caps concurrent downloads (default: 8)')
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                       help='Disable the on-disk cache of NCBI responses')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only print the summary, not per-article progress')
     
     args = parser.parse_args()
     
     crawler = PubMedCrawler(
         output_dir=args.output,
-        api_key=args.api_key
+        api_key=args.api_key,
+        max_workers=args.workers,
+        use_cache=args.use_cache,
+        quiet=args.quiet
     )
     
     crawler.crawl(